@@ -12,6 +12,11 @@ import subprocess as _sps
 __version__ = "0.9.71"
 __author__ = "Deren Eaton & Isaac Overcast"
 
+# layout of saved Assembly JSONs. Bump when params or Sample attrs change.
+# Params of JSONs with this version are restored without their setters,
+# only the files linked by path params are checked to still exist.
+SCHEMA_VERSION = 1
+
 # CLI __main__ changes to 0
 __interactive__ = 1
 
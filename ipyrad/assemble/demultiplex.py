@@ -943,7 +943,9 @@ class BarMatch:
             "tmpdir",
             "tmp_{}_{}.p".format(self.epid, self.fidx))
         with open(pklname, 'wb') as wout:
-            pickle.dump([self.filestat, samplestats], wout)
+            pickle.dump(
+                [self.filestat, samplestats], wout,
+                protocol=pickle.HIGHEST_PROTOCOL)
         return pklname
 
 
@@ -635,7 +635,7 @@ def process_chunk(data, chunksize, chunkfile):
     }
 
     with open(proc.outpickle, 'wb') as outpickle:
-        pickle.dump(out, outpickle)
+        pickle.dump(out, outpickle, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 ##############################################################
@@ -2,7 +2,6 @@
 
 """ ipyrad Assembly class object. """
 
-from __future__ import print_function
 import os
 import glob
 import sys
@@ -16,7 +15,6 @@ import numpy as np
 import pandas as pd
 import ipyrad as ip
 
-from collections import OrderedDict
 from ipyrad.assemble.utils import IPyradError, ObjDict, BADCHARS
 from ipyrad.core.paramsinfo import paraminfo, paramname
 from ipyrad.core.Parallel import Parallel
@@ -721,7 +719,7 @@ class Encoder(json.JSONEncoder):
                 }
             else:
                 return item
-        return super(Encoder, self).encode(hint_tuples(obj))
+        return super().encode(hint_tuples(obj))
 
 
 
@@ -748,25 +746,25 @@ def save_json(data):
     paramsdict = {i: j for (i, j) in paramsdict.items() if i != "_data"}
 
     # store all other dicts
-    datadict = OrderedDict([
-        ("name", data.__dict__["name"]), 
-        ("dirs", data.__dict__["dirs"]),
-        ("paramsdict", paramsdict),
-        ("samples", list(data.__dict__["samples"].keys())),
-        ("populations", data.__dict__["populations"]),
-        ("clust_database", data.__dict__["clust_database"]),        
-        ("snps_database", data.__dict__["snps_database"]),
-        ("seqs_database", data.__dict__["seqs_database"]),
-        ("outfiles", data.__dict__["outfiles"]),
-        ("barcodes", data.__dict__["barcodes"]),
-        ("stats_files", data.__dict__["stats_files"]),
-        ("hackersonly", data.hackersonly._data),
-    ])
+    datadict = {
+        "name": data.name,
+        "dirs": data.dirs,
+        "paramsdict": paramsdict,
+        "samples": list(data.samples),
+        "populations": data.populations,
+        "clust_database": data.clust_database,
+        "snps_database": data.snps_database,
+        "seqs_database": data.seqs_database,
+        "outfiles": data.outfiles,
+        "barcodes": data.barcodes,
+        "stats_files": data.stats_files,
+        "hackersonly": data.hackersonly._data,
+        "schema_version": ip.SCHEMA_VERSION,
+    }
 
     ## sample dict
-    sampledict = OrderedDict([])
-    for key, sample in data.samples.items():
-        sampledict[key] = sample._to_fulldict()
+    sampledict = {
+        key: sample._to_fulldict() for key, sample in data.samples.items()}
 
     ## json format it using cumstom Encoder class
     fulldumps = json.dumps({
@@ -782,17 +780,20 @@ def save_json(data):
     assemblypath = os.path.join(data.params.project_dir, data.name + ".json")
     if not os.path.exists(data.dirs.project):
         os.mkdir(data.dirs.project)
-    
-    ## protect save from interruption
-    done = 0
-    while not done:
-        try:
-            with open(assemblypath, 'w') as jout:
-                jout.write(fulldumps)
-            done = 1
-        except (KeyboardInterrupt, SystemExit): 
-            print('.')
-            continue
+
+    ## protect save from interruption: write to a tmp file and then rename
+    ## it over the old file so a partially written JSON is never left.
+    tmppath = assemblypath + ".tmp"
+    try:
+        with open(tmppath, 'w') as jout:
+            jout.write(fulldumps)
+        os.replace(tmppath, assemblypath)
+
+    # do not leave the partial tmp file behind, not even on interrupt
+    except BaseException:
+        if os.path.exists(tmppath):
+            os.remove(tmppath)
+        raise
 
 
 def merge(name, assemblies, rename_dict=None):
@@ -847,9 +848,9 @@ def merge(name, assemblies, rename_dict=None):
     # iterate over all sample names from all Assemblies
     for data in assemblies:
 
-        # make a deepcopy
-        ndata = copy.deepcopy(data)
-        for sname, sample in ndata.samples.items():
+        # make a deepcopy of the samples
+        nsamples = copy.deepcopy(data.samples)
+        for sname, sample in nsamples.items():
 
             # rename sample if in rename dict
             if sname in rename_dict:
@@ -2,18 +2,36 @@
 
 "loads an archived Assembly object."
 
-from __future__ import print_function
-
 import os
 import json
-import itertools
 import pandas as pd
+import ipyrad as ip
 from ..core.sample import Sample
 from ..core.assembly import Assembly
 from ..assemble.utils import ObjDict
 from ..assemble.utils import IPyradError
 
 
+# user HOME for expanding and shortening paths
+_HOME = os.path.expanduser("~")
+
+# key names of a null Sample, filled on first use by _sample_template()
+_SAMPLE_TEMPLATE = {}
+
+
+def _sample_template():
+    """
+    Returns the attribute, stats, and stats_dfs key names of a null Sample.
+    These only change between ipyrad versions so the Sample is built once.
+    """
+    if not _SAMPLE_TEMPLATE:
+        nsamp = Sample()
+        _SAMPLE_TEMPLATE["keys"] = tuple(nsamp.__dict__)
+        _SAMPLE_TEMPLATE["stats"] = tuple(nsamp.stats.index)
+        _SAMPLE_TEMPLATE["stats_dfs"] = {
+            i: nsamp.stats_dfs[i].index for i in nsamp.stats_dfs}
+    return _SAMPLE_TEMPLATE
+
 
 def load_json(json_path, quiet=False, cli=False):
     """ 
@@ -21,20 +39,33 @@ def load_json(json_path, quiet=False, cli=False):
     Assembly object format 
     """
     # expand HOME in JSON path name
-    json_path = json_path.replace("~", os.path.expanduser("~"))
+    json_path = json_path.replace("~", _HOME)
+
+    # find the JSON file, the .json suffix can be left off the path.
+    locations = [json_path]
+    if not json_path.endswith(".json"):
+        locations.append(json_path + ".json")
+    for location in locations:
+        if os.path.isfile(location):
+            json_path = location
+            break
 
     # raise error if JSON not found
-    if not os.path.exists(json_path):
+    else:
         raise IPyradError("""
             Could not find saved Assembly file (.json) in expected location.
             Checks in: [project_dir]/[assembly_name].json
             Checked: {}
-            """.format(json_path))
+            """.format(", ".join(locations)))
 
     # load JSON file
     with open(json_path, 'rb') as infile:
         fullj = json.loads(infile.read(), object_hook=tup_and_byte)
 
+    # JSONs saved with the current layout skip the legacy checks below
+    current = (
+        fullj["assembly"].pop("schema_version", 0) == ip.SCHEMA_VERSION)
+
     # get name and project_dir from loaded JSON
     oldname = fullj["assembly"].pop("name")
     olddir = fullj["assembly"]["dirs"]["project"]
@@ -46,7 +77,7 @@ def load_json(json_path, quiet=False, cli=False):
 
     # print Loading message with shortened path
     if not quiet:
-        oldpath = oldpath.replace(os.path.expanduser("~"), "~")
+        oldpath = oldpath.replace(_HOME, "~")
         print("{}loading Assembly: {}".format(null._spacer, oldname))
         print("{}from saved path: {}".format(null._spacer, oldpath))
 
@@ -56,23 +87,34 @@ def load_json(json_path, quiet=False, cli=False):
 
     # get params from older JSON, unless key doesn't exist, then use default.
     oldparams = fullj["assembly"].pop("paramsdict")
-    for _param in null.params._keys[1:]:
 
-        # support legacy JSONs: if a new param now exists it is set to default.
-        param = _param.lstrip("_")
-        try:
-            value = oldparams[param]
-        except KeyError:
+    # current JSONs store every param under its private name with a value
+    # that was checked when it was set, so they are assigned directly. The
+    # barcodes and populations they link are loaded with the attrs below.
+    # Linked files are still checked so that a missing file raises the
+    # same error as it does for a legacy JSON (set_params).
+    if current:
+        null.params.__dict__.update(
+            {_param: oldparams[_param] for _param in null.params._keys[1:]})
+        null.params._check_linked_files(pop_assign_file=not cli)
+
+    # support legacy JSONs: if a new param now exists it is set to default.
+    else:
+        for _param in null.params._keys[1:]:
+            param = _param.lstrip("_")
             try:
-                value = oldparams[_param]
+                value = oldparams[param]
             except KeyError:
-                value = getattr(null.params, _param)
+                try:
+                    value = oldparams[_param]
+                except KeyError:
+                    value = getattr(null.params, _param)
 
-        # set param in new null assembly with value from old assembly.
-        if cli and param == "pop_assign_file":
-            null.params._pop_assign_file = value
-        else:
-            null.set_params(param, value)
+            # set param in new null assembly with value from old assembly.
+            if cli and param == "pop_assign_file":
+                null.params._pop_assign_file = value
+            else:
+                null.set_params(param, value)
 
     # Update hackers dict.
     try:
@@ -83,18 +125,15 @@ def load_json(json_path, quiet=False, cli=False):
 
     # Check remaining attributes of Assembly and Raise warning if attributes
     # do not match up between old and new objects
-    newkeys = list(null.__dict__.keys())
-    oldkeys = list(fullj["assembly"].keys())
-
     # find shared keys and deprecated keys
-    sharedkeys = set(oldkeys).intersection(set(newkeys))
+    sharedkeys = fullj["assembly"].keys() & null.__dict__.keys()
 
     # load in remaining shared Assembly attributes to null
     for key in sharedkeys:
         setattr(null, key, fullj["assembly"][key])        
 
     # Now, load in the Sample objects json dicts
-    sample_names = list(fullj["samples"].keys())
+    sample_names = list(fullj["samples"])
     if not sample_names:
         raise IPyradError("""
     No samples found in saved assembly. If you are just starting a new
@@ -105,68 +144,34 @@ def load_json(json_path, quiet=False, cli=False):
     contact the developers.
     """.format(json_path))
         
-    sample_keys = list(fullj["samples"][sample_names[0]].keys())
-    stats_keys = list(fullj["samples"][sample_names[0]]["stats"].keys())
-    stats_dfs_keys = list(fullj["samples"][sample_names[0]]["stats_dfs"].keys())
-    ind_statkeys = (
-        [fullj["samples"][sample_names[0]]["stats_dfs"][i].keys() 
-         for i in stats_dfs_keys])
-    ind_statkeys = list(itertools.chain(*ind_statkeys))
-
-    # check against a null sample
-    nsamp = Sample()
-    newkeys = list(nsamp.__dict__.keys())
-    newstats = list(nsamp.__dict__["stats"].keys())
-    newstatdfs = list(nsamp.__dict__["stats_dfs"].keys())
-    newindstats = [
-        nsamp.__dict__["stats_dfs"][i].keys() for i in newstatdfs]
-    newindstats = list(itertools.chain(*[i.values for i in newindstats]))
-
-    # different in attributes?
-    # diffattr = set(sample_keys).difference(newkeys)
-    # diffstats = set(stats_keys).difference(newstats)
-    # diffindstats = set(ind_statkeys).difference(newindstats)
-    # Raise warning if any oldstats were lost or deprecated
-    # alldiffs = diffattr.union(diffstats).union(diffindstats)
-    # if any(alldiffs):
-    #     LOGGER.warning("""
-    # load_json found {a} keys that are unique to the older Samples.
-    #     - assembly [{b}] v.[{c}] has: {d}
-    #     - current assembly is v.[{e}]
-    #     """.format(a=len(alldiffs), 
-    #                b=oldname,
-    #                c=fullj["assembly"]["_version"],
-    #                d=alldiffs,
-    #                e=null._version))
-
-    # save stats and statsfiles to Samples
-    for sample in null.samples:
-        # create a null Sample
-        null.samples[sample] = Sample()
-
-        # save stats
-        sdat = fullj["samples"][sample]['stats']
-        # Reorder the keys so they ascend by step, only include
-        # stats that are actually in the sample. newstats is a
-        # list of the new sample stat names, and stats_keys
-        # are the names of the stats from the json file.
-        newstats = [x for x in newstats if x in stats_keys]
-        null.samples[sample].stats = pd.Series(sdat).reindex(newstats)
-
-        # save stats_dfs
-        for statskey in stats_dfs_keys:
-            null.samples[sample].stats_dfs[statskey] = (
-                pd.Series(fullj["samples"][sample]["stats_dfs"][statskey])
-                .reindex(
-                    list(nsamp.__dict__["stats_dfs"][statskey].keys())
-                )
-            )
-
-        # save Sample files
-        for filehandle in fullj["samples"][sample]["files"].keys():
-            null.samples[sample].files[filehandle] = (
-                fullj["samples"][sample]["files"][filehandle])
-
+    first_sample = fullj["samples"][sample_names[0]]
+    sample_keys = first_sample.keys()
+    stats_keys = first_sample["stats"].keys()
+    stats_dfs_keys = list(first_sample["stats_dfs"])
+
+    # check against the key names of a null sample
+    template = _sample_template()
+    newkeys = template["keys"]
+    newstats = template["stats"]
+
+    # Reorder the keys so they ascend by step, only include
+    # stats that are actually in the sample. newstats is a
+    # list of the new sample stat names, and stats_keys
+    # are the names of the stats from the json file (a
+    # dict view, so each membership test is a hash lookup).
+    newstats = [x for x in newstats if x in stats_keys]
+
+    ## remaining attributes shared with current Samples are set as is
+    shared_keys = tuple(
+        (sample_keys & newkeys)
+        - {"stats", "files", "stats_files", "stats_dfs"})
+
+    # save stats, stats_dfs, files and other attributes to Samples. The
+    # stat index of each stats_dfs table is taken from the null Sample.
+    statsindex = {i: template["stats_dfs"][i] for i in stats_dfs_keys}
+    null.samples = _build_samples(
+        fullj["samples"], list(null.samples),
+        shared_keys, newstats, statsindex)
 
     # build the Assembly object stats_dfs
     for statskey in stats_dfs_keys:
@@ -174,51 +179,56 @@ def load_json(json_path, quiet=False, cli=False):
         if not indstat.empty:
             null.stats_dfs[statskey] = indstat
 
-    ## add remaning attributes to null Samples
-    shared_keys = set(sample_keys).intersection(newkeys)
-    shared_keys.discard("stats")
-    shared_keys.discard("files")    
-    shared_keys.discard("stats_files")
-    shared_keys.discard("stats_dfs")
+    ## ensure objects are object dicts, those kept from the null Assembly
+    ## (e.g., stats_dfs) already are.
+    for attr in ("dirs", "stats_files", "populations", "outfiles"):
+        value = getattr(null, attr)
+        if not isinstance(value, ObjDict):
+            setattr(null, attr, ObjDict(value))
+    return null
+
+
+
+
+def _build_samples(samples_json, names, shared_keys, newstats, statsindex):
+    """
+    Returns a dict of new Sample objects filled from their saved JSON dicts.
+    Each stats Series is built from its own sample's values so that its 
+    dtype does not depend on the other samples.
+    """
+    samples = {}
+    for sample in names:
+        sjson = samples_json[sample]
+        sdfs = sjson["stats_dfs"]
+
+        # create a null Sample
+        newsample = Sample()
+
+        # save stats
+        newsample.stats = pd.Series(sjson["stats"]).reindex(newstats)
+
+        # save stats_dfs
+        for statskey, index in statsindex.items():
+            newsample.stats_dfs[statskey] = (
+                pd.Series(sdfs[statskey]).reindex(index))
+
+        # save Sample files
+        newsample.files.update(sjson["files"])
 
-    for sample in null.samples:
         ## set the others
         for key in shared_keys:
-            null.samples[sample].__setattr__(key, fullj["samples"][sample][key])
-
-    ## ensure objects are object dicts
-    null.dirs = ObjDict(null.dirs)
-    null.stats_files = ObjDict(null.stats_files)
-    null.stats_dfs = ObjDict(null.stats_dfs)    
-    null.populations = ObjDict(null.populations)
-    null.outfiles = ObjDict(null.outfiles)
-    return null
-
+            setattr(newsample, key, sjson[key])
+        samples[sample] = newsample
+    return samples
 
 
 
 def tup_and_byte(obj):
-    """ this is used in loading """
-
-    # convert all strings to bytes
-    if isinstance(obj, (bytes)):
-        return obj.decode()  # encode('utf-8')
-        #return obj.encode('utf-8')
-
-    # if this is a list of values, return list of byteified values
-    if isinstance(obj, list):
-        return [tup_and_byte(item) for item in obj]
-
-    # if this is a dictionary, return dictionary of byteified keys and values
-    # but only if we haven't already byteified it
-    if isinstance(obj, dict):
-        if "__tuple__" in obj:
-            return tuple(tup_and_byte(item) for item in obj["items"])
-        else:
-            return {
-                tup_and_byte(key): tup_and_byte(val) for
-                key, val in obj.items()
-                }
-
-    # if it's anything else, return it in its original form
+    """ 
+    this is used in loading as the json object_hook. The hook is called
+    bottom-up on every decoded dict, so nested values were already converted
+    and only the __tuple__ hint of this dict needs to be checked.
+    """
+    if "__tuple__" in obj:
+        return tuple(obj["items"])
     return obj
@@ -267,6 +267,31 @@ class Params(object):
         super().__setattr__(key, val)
 
 
+    def _check_linked_files(self, pop_assign_file=True):
+        """
+        Raises the same errors as the setters if a file linked by a path
+        param no longer exists. Used when params are restored without their
+        setters, so barcodes and populations are not re-parsed here.
+        """
+        # these setters only check the path so they are simply re-run
+        self.raw_fastq_path = self._raw_fastq_path
+        self.sorted_fastq_path = self._sorted_fastq_path
+        self.reference_sequence = self._reference_sequence
+        self.reference_as_filter = self._reference_as_filter
+
+        # the barcodes and populations setters would re-read their files
+        value = self._barcodes_path
+        if value and ("Merged:" not in value):
+            if not glob.glob(os.path.realpath(os.path.expanduser(value))):
+                raise IPyradError(BARCODE_NOT_FOUND.format(value))
+
+        value = self._pop_assign_file
+        if pop_assign_file and value:
+            fullpath = os.path.realpath(os.path.expanduser(value))
+            if not os.path.isfile(fullpath):
+                raise IPyradError(POP_FILE_NOT_FOUND.format(fullpath))
+
+
     @property
     def assembly_name(self):
         return self._assembly_name
@@ -712,11 +737,7 @@ class Params(object):
         # if a path is entered, raise exception if not found
         if value:
             if not os.path.isfile(fullpath):
-                raise IPyradError("""
-    Warning: Population assignment file not found. This must be an
-    absolute path (/home/wat/ipyrad/data/my_popfile.txt) or relative to
-    the directory where you're running ipyrad (./data/my_popfile.txt)
-    You entered: {}\n""".format(fullpath))
+                raise IPyradError(POP_FILE_NOT_FOUND.format(fullpath))
             self._pop_assign_file = fullpath
             self._data._link_populations()
 
@@ -823,6 +844,12 @@ doesn't exist, check your path:
 {}
 """
 
+POP_FILE_NOT_FOUND = """
+    Warning: Population assignment file not found. This must be an
+    absolute path (/home/wat/ipyrad/data/my_popfile.txt) or relative to
+    the directory where you're running ipyrad (./data/my_popfile.txt)
+    You entered: {}\n"""
+
 BAD_ASSEMBLY_METHOD = """\
 The assembly_method parameter must be one of the following: denovo, reference,
 denovo+reference or denovo-reference. You entered:
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"round trip tests for saving and loading Assembly JSON files."
+
+import os
+import numpy as np
+import pytest
+import ipyrad as ip
+from ipyrad.core.sample import Sample
+from ipyrad.assemble.utils import IPyradError
+
+
+def test_load_json_keeps_per_sample_dtypes(tmp_path):
+    """
+    A NaN in one sample's stats must not turn the stats of other
+    samples into floats when the Assembly is saved and reloaded.
+    """
+    data = ip.Assembly("roundtrip", quiet=True)
+    data.params.project_dir = str(tmp_path)
+    for name in ("a", "b"):
+        sample = Sample(name)
+        sample.stats = sample.stats.fillna(3).astype(int)
+        sample.stats_dfs.s2 = sample.stats_dfs.s2.fillna(5).astype(int)
+        data.samples[name] = sample
+    data.samples["b"].stats.iloc[1] = np.nan
+    data.samples["b"].stats_dfs.s2.iloc[0] = np.nan
+    data.save()
+
+    loaded = ip.load_json(
+        os.path.join(str(tmp_path), "roundtrip.json"), quiet=True)
+
+    # sample a only had ints
+    stats = loaded.samples["a"].stats
+    assert stats.dtype == np.int64
+    assert stats.tolist() == [3] * stats.size
+    s2 = loaded.samples["a"].stats_dfs.s2
+    assert s2.dtype == np.int64
+    assert s2.tolist() == [5] * s2.size
+
+    # sample b had a NaN
+    assert loaded.samples["b"].stats.dtype == np.float64
+    assert np.isnan(loaded.samples["b"].stats.iloc[1])
+    assert loaded.samples["b"].stats_dfs.s2.dtype == np.float64
+    assert np.isnan(loaded.samples["b"].stats_dfs.s2.iloc[0])
+
+
+
+def test_load_json_checks_linked_files(tmp_path):
+    """
+    A current JSON restores params without their setters, but must still
+    raise if a file linked by a path param was removed.
+    """
+    barcodes = os.path.join(str(tmp_path), "barcodes.txt")
+    with open(barcodes, 'w') as out:
+        out.write("a ACGTA\n")
+
+    data = ip.Assembly("linked", quiet=True)
+    data.params.project_dir = str(tmp_path)
+    data.params.barcodes_path = barcodes
+    data.samples["a"] = Sample("a")
+    data.save()
+
+    json_path = os.path.join(str(tmp_path), "linked.json")
+    loaded = ip.load_json(json_path, quiet=True)
+    assert loaded.params.barcodes_path == data.params.barcodes_path
+    assert loaded.barcodes == {"a": "ACGTA"}
+
+    os.remove(barcodes)
+    with pytest.raises(IPyradError):
+        ip.load_json(json_path, quiet=True)
+
+
+
+def test_load_json_checks_reference_as_filter(tmp_path):
+    """
+    A current JSON must raise like a legacy JSON if the reference_as_filter
+    file was removed.
+    """
+    reference = os.path.join(str(tmp_path), "filter.fa")
+    with open(reference, 'w') as out:
+        out.write(">chr1\nACGTACGT\n")
+
+    data = ip.Assembly("filtered", quiet=True)
+    data.params.project_dir = str(tmp_path)
+    data.params.reference_as_filter = reference
+    data.samples["a"] = Sample("a")
+    data.save()
+
+    json_path = os.path.join(str(tmp_path), "filtered.json")
+    loaded = ip.load_json(json_path, quiet=True)
+    assert loaded.params.reference_as_filter == data.params.reference_as_filter
+
+    os.remove(reference)
+    with pytest.raises(IPyradError):
+        ip.load_json(json_path, quiet=True)